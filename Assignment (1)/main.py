@@ -2,7 +2,7 @@ import sys
 from typing import List, Optional
 import storage
 from task import (
-    Task, add_task, find_task_by_id, delete_task,
+    Task, TaskStore, add_task, find_task_by_id,
     get_pending_tasks, get_in_progress_tasks, get_completed_tasks,
     search_tasks
 )
@@ -14,6 +14,14 @@ RESET = "\033[0m"
 BOLD = "\033[1m"
 CYAN = "\033[36m"
 
+# Skip color codes when output is redirected to a file or pipe
+if not sys.stdout.isatty():
+    BLUE = GREY = RESET = BOLD = CYAN = ""
+
+# Prebuilt row template so colors are not re-embedded for every task
+# (positional %-formatting is the cheapest per row)
+ROW_FMT = f"{GREY}%-10s{RESET} %s%-15s{RESET} %-20s {GREY}%-12s{RESET}"
+
 # --- UI Helper Functions ---
 
 def print_header(title: str) -> None:
@@ -31,23 +39,27 @@ def print_task_list(tasks: List[Task], list_title: str) -> None:
         return
 
     # Header for the table
-    print(f"{BLUE}{'ID':<10} {'Status':<15} {'Title':<20} {'Due Date':<12}{RESET}")
-    print(f"{GREY}{'-'*60}{RESET}")
+    rows = [
+        f"{BLUE}{'ID':<10} {'Status':<15} {'Title':<20} {'Due Date':<12}{RESET}",
+        f"{GREY}{'-'*60}{RESET}"
+    ]
 
     for task in tasks:
         # Color coding status
         status_color = BLUE if task.status != "completed" else GREY
-        status_text = f"{status_color}{task.status}{RESET}"
 
         due = task.due_date if task.due_date else "---"
 
-        print(f"{GREY}{task.id:<10}{RESET} {status_text:<24} {task.title:<20} {GREY}{due:<12}{RESET}")
+        rows.append(ROW_FMT % (task.id, status_color, task.status, task.title, due))
+
+    rows.append(f"{BLUE}{'-'*60}{RESET}")
 
-    print(f"{BLUE}{'-'*60}{RESET}")
+    # Emit the whole table with a single write instead of one per row
+    sys.stdout.write("\n".join(rows) + "\n")
 
 # --- Command Handlers ---
 
-def handle_add_task(tasks: List[Task]) -> List[Task]:
+def handle_add_task(store: TaskStore) -> Task:
     """Gather input and add a new task with optional metadata."""
     print(f"\n{BLUE}[ ADD NEW TASK ]{RESET}")
     title = input(f"{GREY}Enter title: {RESET}").strip()
@@ -55,20 +67,20 @@ def handle_add_task(tasks: List[Task]) -> List[Task]:
     reminder_time = input(f"{GREY}Enter reminder time [optional]: {RESET}").strip()
 
     return add_task(
-        tasks,
+        store,
         title,
         due_date=due_date if due_date else None,
         reminder_time=reminder_time if reminder_time else None
     )
 
-def handle_status_update(tasks: List[Task]) -> None:
+def handle_status_update(store: TaskStore) -> Optional[Task]:
     """Find task and change its specific status."""
     task_id = input(f"\n{BLUE}Enter Task ID to update status: {RESET}").strip()
-    task = find_task_by_id(tasks, task_id)
+    task = find_task_by_id(store, task_id)
 
     if not task:
         print(f"{GREY}Error: Task not found.{RESET}")
-        return
+        return None
 
     print(f"\n{BLUE}Select New Status:{RESET}")
     print(f"{BLUE}1.{RESET} pending")
@@ -81,20 +93,31 @@ def handle_status_update(tasks: List[Task]) -> None:
     if choice in status_map:
         task.update_status(status_map[choice])
         print(f"{BLUE}Success: Status updated to {status_map[choice]}.{RESET}")
-    else:
-        print(f"{GREY}Skipped: Invalid selection.{RESET}")
+        return task
+
+    print(f"{GREY}Skipped: Invalid selection.{RESET}")
+    return None
 
-def handle_search(tasks: List[Task]) -> None:
+def handle_search(store: TaskStore) -> None:
     """Search tasks by title keyword."""
     keyword = input(f"\n{BLUE}Search keyword: {RESET}").strip()
-    results = search_tasks(tasks, keyword)
+    results = search_tasks(store.tasks, keyword)
     print_task_list(results, f"Search Results: '{keyword}'")
 
 def main() -> None:
     """Main application loop with Blue/Grey CLI theme."""
     # Data Persistence: Load tasks at startup
-    task_dicts = storage.load_tasks()
-    tasks = [Task.from_dict(d) for d in task_dicts]
+    try:
+        task_dicts = storage.load_tasks()
+    except RuntimeError as error:
+        # Stop instead of starting empty and overwriting the saved tasks
+        print(f"{GREY}Error: {error}{RESET}")
+        return
+    store = TaskStore([Task.from_dict(d) for d in task_dicts])
+
+    # Data Persistence: Fold replayed changes and any new IDs into a fresh snapshot
+    if storage.has_journal_entries() or store.ids_reassigned:
+        storage.save_tasks([t.to_dict() for t in store])
 
     while True:
         # Clean Menu UI
@@ -116,44 +139,52 @@ def main() -> None:
         choice = input(f"{BOLD}Choose option: {RESET}").strip()
 
         if choice == "1":
-            tasks = handle_add_task(tasks)
+            new_task = handle_add_task(store)
+            # Data Persistence: Journal the change instead of rewriting the file
+            storage.append_mutation(storage.OP_UPSERT, new_task.to_dict())
         elif choice == "2":
-            print_task_list(tasks, "ALL TASKS")
+            print_task_list(store.tasks, "ALL TASKS")
         elif choice == "3":
             task_id = input(f"{BLUE}ID of task to complete: {RESET}").strip()
-            task = find_task_by_id(tasks, task_id)
+            task = find_task_by_id(store, task_id)
             if task:
                 task.mark_completed()
                 print(f"{BLUE}Task marked as done.{RESET}")
+                storage.append_mutation(storage.OP_UPSERT, task.to_dict())
         elif choice == "4":
             task_id = input(f"{BLUE}ID to update title: {RESET}").strip()
-            task = find_task_by_id(tasks, task_id)
+            task = find_task_by_id(store, task_id)
             if task:
                 new_title = input(f"{GREY}New title: {RESET}").strip()
                 task.update_title(new_title)
+                storage.append_mutation(storage.OP_UPSERT, task.to_dict())
         elif choice == "5":
-            handle_status_update(tasks)
+            task = handle_status_update(store)
+            if task:
+                storage.append_mutation(storage.OP_UPSERT, task.to_dict())
         elif choice == "6":
             task_id = input(f"{BLUE}ID to delete: {RESET}").strip()
-            tasks = delete_task(tasks, task_id)
-            print(f"{GREY}Task removed.{RESET}")
+            # Only record a change when a task was actually removed
+            if store.remove(task_id):
+                print(f"{GREY}Task removed.{RESET}")
+                storage.append_mutation(storage.OP_DELETE, {"id": task_id})
+            else:
+                print(f"{GREY}Error: Task not found.{RESET}")
         elif choice == "7":
-            print_task_list(get_pending_tasks(tasks), "PENDING TASKS")
+            print_task_list(get_pending_tasks(store.tasks), "PENDING TASKS")
         elif choice == "8":
-            print_task_list(get_in_progress_tasks(tasks), "IN-PROGRESS TASKS")
+            print_task_list(get_in_progress_tasks(store.tasks), "IN-PROGRESS TASKS")
         elif choice == "9":
-            print_task_list(get_completed_tasks(tasks), "COMPLETED TASKS")
+            print_task_list(get_completed_tasks(store.tasks), "COMPLETED TASKS")
         elif choice == "10":
-            handle_search(tasks)
+            handle_search(store)
         elif choice == "0":
-            storage.save_tasks([t.to_dict() for t in tasks])
+            # Data Persistence: Write a full snapshot and empty the journal
+            storage.save_tasks([t.to_dict() for t in store])
             print(f"{BLUE}Data saved. Goodbye!{RESET}")
             break
         else:
             print(f"{GREY}Invalid option.{RESET}")
 
-        # Data Persistence: Save after every operation
-        storage.save_tasks([t.to_dict() for t in tasks])
-
 if __name__ == "__main__":
     main()
@@ -2,25 +2,211 @@ import json
 import os
 from typing import List, Dict, Any
 
-# File constant
+# Prefer the faster orjson C extension, falling back to stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# MessagePack is optional and only used for ".msgpack" task files
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# File constant (use a ".msgpack" name to store tasks in binary form)
 TASKS_FILE = "tasks.json"
+# Append-only journal of changes made since the last full save
+LOG_FILE = "tasks.log"
+# Journal operation names
+OP_UPSERT = "upsert"
+OP_DELETE = "delete"
+# File extension that selects the MessagePack format
+MSGPACK_EXTENSION = ".msgpack"
+# First bytes of a MessagePack array (fixarray, array 16, array 32)
+MSGPACK_ARRAY_MARKERS = set(range(0x90, 0xA0)) | {0xDC, 0xDD}
+# Larger file buffer (128 KiB) than the 8 KiB default
+BUFFER_SIZE = 1 << 17
+
+def _uses_msgpack() -> bool:
+    """Check whether the tasks file should be stored as MessagePack.
+
+    MessagePack files are smaller and faster to encode and decode than
+    JSON, while JSON stays the default for human readability.
+
+    Returns:
+        True if TASKS_FILE ends with ".msgpack" and msgpack is installed
+    """
+    return msgpack is not None and TASKS_FILE.endswith(MSGPACK_EXTENSION)
+
+def _encode_tasks(tasks: List[Dict[str, Any]]) -> bytes:
+    """Encode tasks to bytes in the configured file format.
+
+    Args:
+        tasks: List of task dictionaries to encode
+
+    Returns:
+        MessagePack data or UTF-8 encoded indented JSON document
+    """
+    # Use the binary MessagePack format when configured
+    if _uses_msgpack():
+        return msgpack.packb(tasks)
+    # Use orjson when installed, it returns bytes directly
+    if orjson is not None:
+        return orjson.dumps(tasks, option=orjson.OPT_INDENT_2)
+    # Otherwise encode with stdlib json and convert to bytes
+    return json.dumps(tasks, indent=2).encode("utf-8")
+
+def _decode_tasks(data: bytes) -> Any:
+    """Decode bytes read from the tasks file.
+
+    The format is picked from the file content rather than the file name,
+    so a file written before msgpack was installed (or removed) still loads.
+
+    Args:
+        data: Raw file content
+
+    Returns:
+        Parsed task data
+
+    Raises:
+        RuntimeError: If the file is MessagePack but msgpack is not installed
+    """
+    # Decode MessagePack when the data starts like a MessagePack array
+    if data[0] in MSGPACK_ARRAY_MARKERS:
+        if msgpack is None:
+            raise RuntimeError(
+                f"{TASKS_FILE} is stored as MessagePack; install msgpack to load it"
+            )
+        return msgpack.unpackb(data, raw=False)
+    # Use orjson when installed, otherwise stdlib json accepts bytes too
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _encode_line(entry: Dict[str, Any]) -> bytes:
+    """Encode one journal entry as a single compact JSON line.
+
+    Args:
+        entry: Journal entry to encode
+
+    Returns:
+        UTF-8 encoded JSON followed by a newline
+    """
+    # Use orjson when installed, otherwise stdlib json without extra spaces
+    if orjson is not None:
+        return orjson.dumps(entry) + b"\n"
+    return json.dumps(entry, separators=(",", ":")).encode("utf-8") + b"\n"
+
+def append_mutation(op: str, task: Dict[str, Any]) -> None:
+    """Record a single task change in the journal without rewriting the tasks file.
+
+    Args:
+        op: OP_UPSERT for an added or changed task, OP_DELETE for a removed one
+        task: Task dictionary (only "id" is needed for OP_DELETE)
+    """
+    # Attempt to append the change, failing silently if error occurs
+    try:
+        with open(LOG_FILE, 'ab') as file:
+            file.write(_encode_line({"op": op, "t": task}))
+    except Exception:
+        # Silently fail as per CLAUDE.md guidance for non-critical operations
+        pass
+
+def _replay_log(tasks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Apply journaled changes on top of the tasks loaded from the snapshot.
+
+    Args:
+        tasks: Task dictionaries from the tasks file
+
+    Returns:
+        Task dictionaries with every journaled change applied
+    """
+    # Nothing to replay if there is no journal
+    if not os.path.exists(LOG_FILE):
+        return tasks
+
+    with open(LOG_FILE, 'rb', buffering=BUFFER_SIZE) as file:
+        lines = file.read().splitlines()
+    if not lines:
+        return tasks
+
+    # Key tasks by ID, keeping order; tasks with a missing or repeated ID get
+    # a unique key so replaying never merges two snapshot entries
+    by_id: Dict[Any, Dict[str, Any]] = {}
+    for index, task in enumerate(tasks):
+        task_id = task.get("id") if isinstance(task, dict) else None
+        if task_id is None or task_id in by_id:
+            task_id = (task_id, index)
+        by_id[task_id] = task
+
+    # Apply each change in the order it was made
+    for line in lines:
+        try:
+            entry = json.loads(line) if orjson is None else orjson.loads(line)
+            op = entry["op"]
+            task = entry["t"]
+            task_id = task["id"]
+            # Task IDs are always strings; anything else is a corrupted line
+            if not isinstance(task_id, str):
+                continue
+
+            if op == OP_UPSERT:
+                by_id[task_id] = task
+            elif op == OP_DELETE:
+                by_id.pop(task_id, None)
+        except Exception:
+            # Skip a torn or corrupted line, e.g. from a crash mid-write
+            continue
+
+    return list(by_id.values())
+
+def has_journal_entries() -> bool:
+    """Check whether the journal holds changes not yet in the tasks file.
+
+    Returns:
+        True if the journal file exists and is not empty
+    """
+    try:
+        return os.path.getsize(LOG_FILE) > 0
+    except OSError:
+        # A missing or unreadable journal has nothing to replay
+        return False
+
+def _clear_log() -> None:
+    """Empty the journal once its changes are part of the tasks file."""
+    if os.path.exists(LOG_FILE):
+        open(LOG_FILE, 'wb').close()
 
 def save_tasks(tasks: List[Dict[str, Any]]) -> None:
-    """Save tasks to JSON file.
+    """Save tasks to JSON (or MessagePack) file and empty the journal.
 
     Args:
         tasks: List of task dictionaries to save
     """
+    # Write to a temporary file first so a crash cannot leave a torn file
+    temp_file = TASKS_FILE + ".tmp"
+
     # Attempt to save current data, failing silently if error occurs
     try:
-        with open(TASKS_FILE, 'w') as file:
-            json.dump(tasks, file, indent=2)
+        # Encode once and write once instead of many small writes
+        payload = _encode_tasks(tasks)
+        with open(temp_file, 'wb', buffering=BUFFER_SIZE) as file:
+            file.write(payload)
+        # Swap the finished file into place in a single rename
+        os.replace(temp_file, TASKS_FILE)
+        # The snapshot now holds every journaled change
+        _clear_log()
     except Exception:
-        # Silently fail as per CLAUDE.md guidance for non-critical operations
-        pass
+        # Remove a leftover temporary file, then fail silently as per
+        # CLAUDE.md guidance for non-critical operations
+        try:
+            os.remove(temp_file)
+        except OSError:
+            pass
 
-def load_tasks() -> List[Dict[str, Any]]:
-    """Load tasks from JSON file.
+def _load_snapshot() -> List[Dict[str, Any]]:
+    """Load tasks from JSON (or MessagePack) file.
 
     Returns:
         List of tasks or empty list if file missing or corrupted
@@ -29,15 +215,43 @@ def load_tasks() -> List[Dict[str, Any]]:
     if not os.path.exists(TASKS_FILE):
         return []
 
-    # Attempt to load and parse JSON content
+    # Attempt to load and parse file content
     try:
-        with open(TASKS_FILE, 'r') as file:
-            data = json.load(file)
+        # Read the whole file in one shot before parsing
+        with open(TASKS_FILE, 'rb', buffering=BUFFER_SIZE) as file:
+            raw = file.read()
+
+        # An empty file simply means there are no tasks yet
+        if not raw:
+            return []
+        data = _decode_tasks(raw)
 
         # Ensure data is the expected list format
         if isinstance(data, list):
             return data
         return []
+    except RuntimeError:
+        # Unreadable format: stop rather than overwrite the file with no tasks
+        raise
     except (json.JSONDecodeError, Exception):
         # Return safe default empty list on any error
         return []
+
+def load_tasks() -> List[Dict[str, Any]]:
+    """Load tasks from the tasks file, then replay the journal on top.
+
+    Returns:
+        List of tasks or empty list if file missing or corrupted
+
+    Raises:
+        RuntimeError: If the file is MessagePack but msgpack is not installed,
+            or if the journal exists but cannot be read
+    """
+    tasks = _load_snapshot()
+
+    # Attempt to replay journaled changes; on failure stop rather than let a
+    # later save compact the journal away with its changes unapplied
+    try:
+        return _replay_log(tasks)
+    except Exception as error:
+        raise RuntimeError(f"could not replay {LOG_FILE}: {error}") from error
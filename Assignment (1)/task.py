@@ -1,13 +1,24 @@
+import sys
 from datetime import datetime
-from typing import List, Dict, Any, Optional, Literal
+from typing import List, Dict, Any, Optional, Literal, Iterator, Tuple
 
 # Allowed status values
 TaskStatus = Literal["pending", "in-progress", "completed"]
-ALLOWED_STATUSES = ["pending", "in-progress", "completed"]
+# Interned so every task shares one string object per status
+_PENDING = sys.intern("pending")
+_IN_PROGRESS = sys.intern("in-progress")
+_COMPLETED = sys.intern("completed")
+ALLOWED_STATUSES = [_PENDING, _IN_PROGRESS, _COMPLETED]
 
 class Task:
     """Represents a single todo task."""
 
+    # Fixed attribute layout keeps each task small in memory
+    __slots__ = (
+        "id", "title", "status", "completed", "created_at",
+        "due_date", "reminder_time", "completed_at", "_dict_cache", "_title_lower"
+    )
+
     def __init__(
         self,
         title: str,
@@ -16,7 +27,8 @@ class Task:
         task_id: Optional[str] = None,
         due_date: Optional[str] = None,
         reminder_time: Optional[str] = None,
-        completed_at: Optional[str] = None
+        completed_at: Optional[str] = None,
+        created_at: Optional[str] = None
     ):
         # Use provided ID for loading from storage, or generate sequential numeric ID
         if task_id:
@@ -33,11 +45,14 @@ class Task:
 
         # Validate title with a safe default if invalid
         self.title = self._validate_title(title)
+        # Lowercased title kept ready for case-insensitive search
+        self._title_lower = self.title.lower()
         # Validate status with a safe default if invalid
         self.status = self._validate_status(status)
         # Sync completed boolean with status
         self.completed = completed or (self.status == "completed")
-        self.created_at = datetime.now().isoformat()
+        # Keep a stored creation time, only stamping the current time for new tasks
+        self.created_at = created_at or datetime.now().isoformat()
 
         # Optional fields
         self.due_date = due_date
@@ -48,6 +63,9 @@ class Task:
         if self.completed and not self.completed_at:
             self.completed_at = datetime.now().isoformat()
 
+        # Cached storage dictionary, rebuilt only after the task changes
+        self._dict_cache: Optional[Dict[str, Any]] = None
+
     def set_task_id(self, task_id: int) -> None:
         """Set the task ID to a numeric value.
 
@@ -55,6 +73,7 @@ class Task:
             task_id: Integer ID for the task
         """
         self.id = str(task_id)
+        self._dict_cache = None
 
     def _validate_title(self, title: Optional[str]) -> str:
         """Validate title and return default if invalid."""
@@ -67,14 +86,16 @@ class Task:
     def _validate_status(self, status: Any) -> TaskStatus:
         """Validate status value and return default 'pending' if invalid."""
         if status in ALLOWED_STATUSES:
-            return status
-        return "pending"
+            # Return the shared interned copy so comparisons hit the identity fast path
+            return sys.intern(status)
+        return _PENDING
 
     def mark_completed(self) -> None:
         """Mark the task as completed and update status and timestamp."""
         self.completed = True
-        self.status = "completed"
+        self.status = _COMPLETED
         self.completed_at = datetime.now().isoformat()
+        self._dict_cache = None
 
     def update_status(self, new_status: str) -> None:
         """Update task status with validation and sync completed state."""
@@ -86,22 +107,31 @@ class Task:
         else:
             self.completed = False
             self.completed_at = None
+        self._dict_cache = None
 
     def update_title(self, new_title: str) -> None:
         """Update task title with validation."""
         self.title = self._validate_title(new_title)
+        self._title_lower = self.title.lower()
+        self._dict_cache = None
 
     def set_due_date(self, due_date: Optional[str]) -> None:
         """Update the due date."""
         self.due_date = due_date
+        self._dict_cache = None
 
     def set_reminder_time(self, reminder_time: Optional[str]) -> None:
         """Update the reminder time."""
         self.reminder_time = reminder_time
+        self._dict_cache = None
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert task to dictionary for storage."""
-        return {
+        """Convert task to dictionary for storage, reusing the cached copy."""
+        # Reuse the cached dictionary if nothing changed since last call
+        if self._dict_cache is not None:
+            return self._dict_cache
+
+        self._dict_cache = {
             "id": self.id,
             "title": self.title,
             "status": self.status,
@@ -111,6 +141,7 @@ class Task:
             "reminder_time": self.reminder_time,
             "completed_at": self.completed_at
         }
+        return self._dict_cache
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Task':
@@ -123,9 +154,9 @@ class Task:
             task_id=data.get("id"),
             due_date=data.get("due_date"),
             reminder_time=data.get("reminder_time"),
-            completed_at=data.get("completed_at")
+            completed_at=data.get("completed_at"),
+            created_at=data.get("created_at")
         )
-        task.created_at = data.get("created_at", datetime.now().isoformat())
         return task
 
 def get_next_task_id(existing_tasks: List[Task]) -> int:
@@ -157,64 +188,145 @@ def get_next_task_id(existing_tasks: List[Task]) -> int:
     else:
         return 1
 
+class TaskStore:
+    """Holds tasks keyed by ID, in display (insertion) order."""
+
+    def __init__(self, tasks: Optional[List[Task]] = None):
+        # Tasks keyed by ID; dicts keep insertion order, so this is also the display order
+        self._by_id: Dict[str, Task] = {}
+        loaded = tasks or []
+        # True when a loaded task had to be given a new ID
+        self.ids_reassigned = False
+
+        # Scan IDs once at load time, then hand out IDs from a counter
+        self._next_id = get_next_task_id(loaded)
+
+        # Register any tasks loaded from storage
+        for task in loaded:
+            # Give tasks with a missing or duplicate ID a fresh one so none are lost
+            if task.id is None or task.id in self._by_id:
+                task.set_task_id(self.allocate_id())
+                self.ids_reassigned = True
+            self.add(task)
+
+    @property
+    def tasks(self) -> List[Task]:
+        """Return the tasks in display order."""
+        return list(self._by_id.values())
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __iter__(self) -> Iterator[Task]:
+        return iter(self._by_id.values())
+
+    def add(self, task: Task) -> None:
+        """Add a task at the end of the display order."""
+        self._by_id[task.id] = task
+
+    def allocate_id(self) -> int:
+        """Return the next unused numeric ID and advance the counter."""
+        next_id = self._next_id
+        self._next_id += 1
+        return next_id
+
+    def get(self, task_id: str) -> Optional[Task]:
+        """Return the task with the given ID, or None if not found."""
+        return self._by_id.get(task_id)
+
+    def remove(self, task_id: str) -> bool:
+        """Remove the task with the given ID in constant time.
+
+        Args:
+            task_id: ID of the task to remove
+
+        Returns:
+            True if a task was removed, False if the ID was not found
+        """
+        return self._by_id.pop(task_id, None) is not None
+
 # --- Core Task Operations ---
 
 def add_task(
-    tasks: List[Task],
+    store: TaskStore,
     title: str,
     status: str = "pending",
     due_date: Optional[str] = None,
     reminder_time: Optional[str] = None
-) -> List[Task]:
-    """Add a new task with optional fields to the list."""
+) -> Task:
+    """Add a new task with optional fields to the store and return it."""
     # Create task without ID first
     new_task = Task(title, status=status, due_date=due_date, reminder_time=reminder_time)
 
-    # Get next available numeric ID
-    next_id = get_next_task_id(tasks)
+    # Get next available numeric ID from the store counter
+    next_id = store.allocate_id()
     new_task.set_task_id(next_id)
 
-    tasks.append(new_task)
-    return tasks
+    store.add(new_task)
+    return new_task
 
-def find_task_by_id(tasks: List[Task], task_id: str) -> Optional[Task]:
-    """Search for a task by ID, returning None if not found."""
-    for task in tasks:
-        if task.id == task_id:
-            return task
-    return None
+def find_task_by_id(store: TaskStore, task_id: str) -> Optional[Task]:
+    """Look up a task by ID, returning None if not found."""
+    return store.get(task_id)
 
-def delete_task(tasks: List[Task], task_id: str) -> List[Task]:
-    """Remove a task from the list and return updated list."""
-    return [t for t in tasks if t.id != task_id]
+def delete_task(store: TaskStore, task_id: str) -> TaskStore:
+    """Remove a task from the store and return the updated store."""
+    store.remove(task_id)
+    return store
 
 # --- Filtering and Search Functions ---
 
 def get_pending_tasks(tasks: List[Task]) -> List[Task]:
     """Return only tasks that are currently pending. Handles empty lists gracefully."""
-    if not tasks:
-        return []
-    return [t for t in tasks if t.status == "pending"]
+    return [t for t in tasks if t.status is _PENDING]
 
 def get_in_progress_tasks(tasks: List[Task]) -> List[Task]:
     """Return only tasks that are currently in progress. Handles empty lists gracefully."""
-    if not tasks:
-        return []
-    return [t for t in tasks if t.status == "in-progress"]
+    return [t for t in tasks if t.status is _IN_PROGRESS]
 
 def get_completed_tasks(tasks: List[Task]) -> List[Task]:
     """Return only tasks that are completed. Handles empty lists gracefully."""
-    if not tasks:
-        return []
-    return [t for t in tasks if t.status == "completed"]
+    return [t for t in tasks if t.status is _COMPLETED]
+
+def partition_by_status(tasks: List[Task]) -> Tuple[List[Task], List[Task], List[Task]]:
+    """Split tasks into pending, in-progress and completed lists in one pass.
+
+    A task with an unexpected status goes into the pending list, matching
+    the 'pending' default used when validating statuses.
+
+    Args:
+        tasks: List of tasks to split
+
+    Returns:
+        Tuple of (pending, in_progress, completed) task lists
+    """
+    pending: List[Task] = []
+    in_progress: List[Task] = []
+    completed: List[Task] = []
+
+    # Map each interned status to its bucket's append method (one lookup per task)
+    dispatch = {
+        _PENDING: pending.append,
+        _IN_PROGRESS: in_progress.append,
+        _COMPLETED: completed.append
+    }
+
+    # Bind the fallback once; unknown statuses are treated as pending
+    get_bucket = dispatch.get
+    add_pending = pending.append
+
+    for task in tasks:
+        get_bucket(task.status, add_pending)(task)
+
+    return pending, in_progress, completed
 
 def search_tasks(tasks: List[Task], keyword: str) -> List[Task]:
     """Search tasks by title keyword (case-insensitive)."""
-    if not tasks or not keyword or not isinstance(keyword, str):
-        return []
+    # Callers pass a string; only checked when assertions are enabled
+    assert isinstance(keyword, str), "keyword must be a string"
 
     keyword_lower = keyword.lower().strip()
     if not keyword_lower:
         return []
 
-    return [t for t in tasks if keyword_lower in t.title.lower()]
+    return [t for t in tasks if keyword_lower in t._title_lower]
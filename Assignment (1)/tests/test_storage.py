@@ -0,0 +1,206 @@
+import os
+import shutil
+import sys
+import tempfile
+from contextlib import contextmanager
+from typing import List, Dict, Any, Iterator
+
+# Make the app modules importable when running this file directly
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import storage
+from task import Task, TaskStore
+
+@contextmanager
+def temp_storage() -> Iterator[str]:
+    """Point storage at fresh files in a temporary directory, then clean up.
+
+    Yields:
+        Path of the temporary directory
+    """
+    temp_dir = tempfile.mkdtemp()
+    # Remember the real settings so each test leaves storage unchanged
+    saved = (storage.TASKS_FILE, storage.LOG_FILE, storage.msgpack)
+    storage.TASKS_FILE = os.path.join(temp_dir, "tasks.json")
+    storage.LOG_FILE = os.path.join(temp_dir, "tasks.log")
+
+    try:
+        yield temp_dir
+    finally:
+        storage.TASKS_FILE, storage.LOG_FILE, storage.msgpack = saved
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+def write_log(lines: List[bytes]) -> None:
+    """Write raw journal lines to the journal file."""
+    with open(storage.LOG_FILE, 'wb') as file:
+        file.write(b"".join(lines))
+
+def titles(tasks: List[Dict[str, Any]]) -> List[str]:
+    """Return the titles of task dictionaries in order."""
+    return [t["title"] for t in tasks]
+
+def test_replay_upsert_then_delete():
+    """Test that journaled upserts and deletes are applied in order."""
+    print("Testing journal replay...")
+    with temp_storage():
+
+        # Snapshot with two tasks, then change one and delete the other
+        storage.save_tasks([{"id": "1", "title": "A"}, {"id": "2", "title": "B"}])
+        storage.append_mutation(storage.OP_UPSERT, {"id": "1", "title": "A2"})
+        storage.append_mutation(storage.OP_UPSERT, {"id": "3", "title": "C"})
+        storage.append_mutation(storage.OP_DELETE, {"id": "2"})
+
+        assert titles(storage.load_tasks()) == ["A2", "C"]
+
+    print("✓ Journal replay tests passed")
+
+def test_torn_last_line_is_skipped():
+    """Test that a half-written final journal line is ignored."""
+    print("Testing torn journal line...")
+    with temp_storage():
+
+        storage.save_tasks([{"id": "1", "title": "A"}])
+        storage.append_mutation(storage.OP_UPSERT, {"id": "1", "title": "A2"})
+        # Simulate a crash in the middle of writing the next line
+        with open(storage.LOG_FILE, 'ab') as file:
+            file.write(b'{"op":"upsert","t":{"id":"1","ti')
+
+        assert titles(storage.load_tasks()) == ["A2"]
+
+    print("✓ Torn journal line tests passed")
+
+def test_corrupted_line_is_skipped():
+    """Test that a journal line with a bad ID is skipped, not fatal."""
+    print("Testing corrupted journal line...")
+    with temp_storage():
+        storage.save_tasks([{"id": "1", "title": "A"}])
+        write_log([
+            b'{"op":"upsert","t":{"id":"2","title":"B"}}\n',
+            b'{"op":"upsert","t":{"id":["x"],"title":"junk"}}\n',
+            b'{"op":"delete","t":{"id":{"x":1}}}\n',
+            b'{"op":"upsert","t":{"id":"3","title":"C"}}\n'
+        ])
+
+        assert titles(storage.load_tasks()) == ["A", "B", "C"]
+
+    print("✓ Corrupted journal line tests passed")
+
+def test_unreadable_log_stops_loading():
+    """Test that a journal which cannot be read raises instead of being dropped."""
+    print("Testing unreadable journal...")
+    with temp_storage():
+        storage.save_tasks([{"id": "1", "title": "A"}])
+        # A directory in place of the journal cannot be opened for reading
+        os.mkdir(storage.LOG_FILE)
+
+        try:
+            storage.load_tasks()
+            assert False, "Should have raised RuntimeError"
+        except RuntimeError:
+            pass  # Expected
+
+    print("✓ Unreadable journal tests passed")
+
+def test_save_clears_log():
+    """Test that a full save empties the journal."""
+    print("Testing journal compaction...")
+    with temp_storage():
+
+        storage.append_mutation(storage.OP_UPSERT, {"id": "1", "title": "A"})
+        assert storage.has_journal_entries()
+
+        storage.save_tasks(storage.load_tasks())
+        assert not storage.has_journal_entries()
+        assert titles(storage.load_tasks()) == ["A"]
+
+    print("✓ Journal compaction tests passed")
+
+def test_failed_save_removes_temp_file():
+    """Test that a failed save does not leave the temporary file behind."""
+    print("Testing failed save cleanup...")
+    with temp_storage() as temp_dir:
+
+        # A directory in place of the tasks file makes the final rename fail
+        os.mkdir(storage.TASKS_FILE)
+        storage.save_tasks([{"id": "1", "title": "A"}])
+
+        assert os.listdir(temp_dir) == ["tasks.json"]
+
+    print("✓ Failed save cleanup tests passed")
+
+def test_duplicate_snapshot_ids_survive_replay():
+    """Test that tasks sharing an ID are both kept when a journal exists."""
+    print("Testing duplicate IDs during replay...")
+    with temp_storage():
+
+        storage.save_tasks([{"id": "1", "title": "P"}, {"id": "1", "title": "Q"}])
+        write_log([b'{"op":"delete","t":{"id":"9"}}\n'])
+
+        assert titles(storage.load_tasks()) == ["P", "Q"]
+
+    print("✓ Duplicate ID replay tests passed")
+
+def test_reassigned_id_is_not_duplicated():
+    """Test that a task given a new ID at load is not duplicated after a restart."""
+    print("Testing reassigned IDs after restart...")
+    with temp_storage():
+
+        storage.save_tasks([{"id": "abc", "title": "X"}, {"id": "5", "title": "Y"}])
+
+        # First session: the invalid ID is replaced and the store is compacted
+        store = TaskStore([Task.from_dict(d) for d in storage.load_tasks()])
+        assert store.ids_reassigned
+        storage.save_tasks([t.to_dict() for t in store])
+
+        # Change the task and quit without a final save
+        task = store.get("6")
+        task.mark_completed()
+        storage.append_mutation(storage.OP_UPSERT, task.to_dict())
+
+        # Second session sees the change exactly once
+        store = TaskStore([Task.from_dict(d) for d in storage.load_tasks()])
+        assert [(t.id, t.status) for t in store] == [("6", "completed"), ("5", "pending")]
+        assert not store.ids_reassigned
+
+    print("✓ Reassigned ID tests passed")
+
+def test_format_detected_from_content():
+    """Test that the file format is read from the content, not the name."""
+    print("Testing storage format detection...")
+    with temp_storage() as temp_dir:
+        storage.TASKS_FILE = os.path.join(temp_dir, "tasks.msgpack")
+
+        # Without msgpack a ".msgpack" file is written as JSON and still loads
+        storage.msgpack = None
+        storage.save_tasks([{"id": "1", "title": "A"}])
+        assert titles(storage.load_tasks()) == ["A"]
+
+        # MessagePack data cannot be read without msgpack, so loading must stop
+        with open(storage.TASKS_FILE, 'wb') as file:
+            file.write(b"\x91\x81\xa5title\xa1A")
+        try:
+            storage.load_tasks()
+            assert False, "Should have raised RuntimeError"
+        except RuntimeError:
+            pass  # Expected
+
+    print("✓ Storage format detection tests passed")
+
+def run_all_tests():
+    """Run the storage test suite."""
+    print("Running tests...")
+
+    test_replay_upsert_then_delete()
+    test_torn_last_line_is_skipped()
+    test_corrupted_line_is_skipped()
+    test_unreadable_log_stops_loading()
+    test_save_clears_log()
+    test_failed_save_removes_temp_file()
+    test_duplicate_snapshot_ids_survive_replay()
+    test_reassigned_id_is_not_duplicated()
+    test_format_detected_from_content()
+
+    print("All tests completed!")
+
+if __name__ == "__main__":
+    run_all_tests()
@@ -0,0 +1,148 @@
+import os
+import sys
+
+# Make the app modules importable when running this file directly
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from task import Task, TaskStore, add_task, partition_by_status
+
+def test_store_reassigns_missing_and_duplicate_ids():
+    """Test that loaded tasks with a missing or repeated ID get fresh IDs."""
+    print("Testing ID reassignment at load...")
+
+    # Normal case: valid unique IDs are kept as they are
+    store = TaskStore([Task("A", task_id="1"), Task("B", task_id="3")])
+    assert [t.id for t in store] == ["1", "3"]
+    assert not store.ids_reassigned
+
+    # Invalid and duplicate IDs get new IDs after the highest one, in order
+    store = TaskStore([
+        Task("A", task_id="2"),
+        Task("B", task_id="abc"),
+        Task("C", task_id="2"),
+        Task("D")
+    ])
+    assert [(t.id, t.title) for t in store] == [("2", "A"), ("3", "B"), ("4", "C"), ("5", "D")]
+    assert store.ids_reassigned
+    assert store.get("4").title == "C"
+
+    print("✓ ID reassignment tests passed")
+
+def test_allocate_id_never_reuses_ids():
+    """Test that the ID counter keeps counting up, even after deletes."""
+    print("Testing ID allocation...")
+
+    # Empty store starts at 1
+    assert TaskStore().allocate_id() == 1
+
+    # Counter starts after the highest loaded ID and advances on each call
+    store = TaskStore([Task("A", task_id="7")])
+    assert store.allocate_id() == 8
+    assert store.allocate_id() == 9
+
+    # Deleting the newest task does not free its ID
+    new_task = add_task(store, "B")
+    assert new_task.id == "10"
+    store.remove("10")
+    assert add_task(store, "C").id == "11"
+
+    print("✓ ID allocation tests passed")
+
+def test_store_remove():
+    """Test removing tasks by ID."""
+    print("Testing task removal...")
+    store = TaskStore([Task("A", task_id="1"), Task("B", task_id="2"), Task("C", task_id="3")])
+
+    # Removing an existing task keeps the others in order
+    assert store.remove("2")
+    assert [t.id for t in store] == ["1", "3"]
+    assert store.get("2") is None
+    assert len(store) == 2
+
+    # Removing an unknown or already removed ID reports nothing removed
+    assert not store.remove("2")
+    assert not store.remove("99")
+    assert len(store) == 2
+
+    print("✓ Task removal tests passed")
+
+def test_to_dict_cache_is_refreshed_by_every_mutator():
+    """Test that each mutating method makes to_dict() return fresh data."""
+    print("Testing to_dict cache invalidation...")
+    task = Task("Old title", task_id="1")
+
+    # Repeated calls without changes reuse the cached dictionary
+    assert task.to_dict() is task.to_dict()
+
+    # Each mutator must be reflected in the next to_dict() call
+    task.to_dict()
+    task.set_task_id(2)
+    assert task.to_dict()["id"] == "2"
+
+    task.update_title("New title")
+    assert task.to_dict()["title"] == "New title"
+
+    task.set_due_date("2026-12-31")
+    assert task.to_dict()["due_date"] == "2026-12-31"
+
+    task.set_reminder_time("09:00")
+    assert task.to_dict()["reminder_time"] == "09:00"
+
+    task.update_status("in-progress")
+    assert task.to_dict()["status"] == "in-progress"
+    assert not task.to_dict()["completed"]
+
+    task.mark_completed()
+    assert task.to_dict()["status"] == "completed"
+    assert task.to_dict()["completed"]
+    assert task.to_dict()["completed_at"]
+
+    task.update_status("pending")
+    assert task.to_dict()["status"] == "pending"
+    assert task.to_dict()["completed_at"] is None
+
+    print("✓ to_dict cache invalidation tests passed")
+
+def test_partition_by_status():
+    """Test splitting tasks into status buckets in one pass."""
+    print("Testing status partitioning...")
+
+    # Empty input gives three empty lists
+    assert partition_by_status([]) == ([], [], [])
+
+    # Each task lands in its status bucket, keeping the original order
+    tasks = [
+        Task("A"),
+        Task("B", status="completed"),
+        Task("C", status="in-progress"),
+        Task("D"),
+        Task("E", status="completed")
+    ]
+    pending, in_progress, completed = partition_by_status(tasks)
+    assert [t.title for t in pending] == ["A", "D"]
+    assert [t.title for t in in_progress] == ["C"]
+    assert [t.title for t in completed] == ["B", "E"]
+
+    # A status that bypassed validation is treated as pending
+    odd_task = Task("F")
+    odd_task.status = "archived"
+    pending, in_progress, completed = partition_by_status([odd_task])
+    assert pending == [odd_task]
+    assert in_progress == [] and completed == []
+
+    print("✓ Status partitioning tests passed")
+
+def run_all_tests():
+    """Run the task test suite."""
+    print("Running tests...")
+
+    test_store_reassigns_missing_and_duplicate_ids()
+    test_allocate_id_never_reuses_ids()
+    test_store_remove()
+    test_to_dict_cache_is_refreshed_by_every_mutator()
+    test_partition_by_status()
+
+    print("All tests completed!")
+
+if __name__ == "__main__":
+    run_all_tests()